@@ -1,10 +1,11 @@
 """AI message."""
 
-import itertools
 import json
 import logging
+import math
 import operator
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from enum import Enum
 from typing import Any, Literal, cast, overload
 
 from pydantic import Field, model_validator
@@ -21,6 +22,9 @@ from langchain_core.messages.content import InvalidToolCall
 from langchain_core.messages.tool import (
     ToolCall,
     ToolCallChunk,
+    _invalid_tool_call_from_dict,
+    _tool_call_chunk_from_dict,
+    _tool_call_from_dict,
     default_tool_chunk_parser,
     default_tool_parser,
 )
@@ -32,9 +36,77 @@ from langchain_core.utils.json import parse_partial_json
 from langchain_core.utils.usage import _dict_int_op
 from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def _tool_args_default(obj: Any) -> Any:
+    """Encode values that aren't natively JSON-serializable in tool call args.
+
+    Shared by the `orjson` and standard library encoders so both produce the same
+    output: enums are encoded by value and everything else by `str()`.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def _replace_non_finite_floats(obj: Any) -> Any:
+    """Replace `NaN` and infinite floats with `None`, as `orjson` encodes them."""
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite_floats(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite_floats(v) for v in obj]
+    return obj
+
+
+def _dumps_tool_args(args: Any) -> str:
+    """Serialize tool call args to a compact JSON string.
+
+    Uses `orjson` when it is installed, falling back to the standard library for
+    payloads `orjson` can't encode (e.g. integers wider than 64 bits). Both paths
+    emit the same compact, non-ASCII-escaped layout, encode non-native values with
+    `_tool_args_default` and encode non-finite floats as `null`.
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                args,
+                default=_tool_args_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    try:
+        return json.dumps(
+            args,
+            default=_tool_args_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            allow_nan=False,
+        )
+    except ValueError as e:
+        # Only retry for non-finite floats, not e.g. circular references
+        if "Out of range float values" not in str(e):
+            raise
+    return json.dumps(
+        _replace_non_finite_floats(args),
+        default=_tool_args_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+    )
+
+
 class InputTokenDetails(TypedDict, total=False):
     """Breakdown of input token counts.
 
@@ -157,6 +229,20 @@ class UsageMetadata(TypedDict):
     """
 
 
+_BASE_USAGE_KEYS = frozenset(("input_tokens", "output_tokens", "total_tokens"))
+"""Keys of a `UsageMetadata` that carries no token details."""
+
+
+_TOOL_CALL_KEYS = frozenset(("name", "args", "id", "type"))
+_INVALID_TOOL_CALL_KEYS = frozenset(("name", "args", "id", "error", "type"))
+_TOOL_CALL_CHUNK_KEYS = frozenset(("name", "args", "id", "index", "type"))
+
+
+def _is_typed_dict_of(tc: Any, type_: str, keys: frozenset[str]) -> bool:
+    """Check if `tc` already has exactly the given keys and `type` value."""
+    return isinstance(tc, dict) and tc.keys() == keys and tc["type"] == type_
+
+
 class AIMessage(BaseMessage):
     """Message from an AI.
 
@@ -328,23 +414,28 @@ class AIMessage(BaseMessage):
             except Exception:
                 logger.debug("Failed to parse tool calls", exc_info=True)
 
-        # Ensure "type" is properly set on all tool call-like dicts.
+        # Ensure "type" is properly set on all tool call-like dicts. Dicts that are
+        # already well-formed are kept as-is (field validation copies them anyway).
         if tool_calls := values.get("tool_calls"):
             values["tool_calls"] = [
-                create_tool_call(
-                    **{k: v for k, v in tc.items() if k not in {"type", "extras"}}
-                )
+                tc
+                if _is_typed_dict_of(tc, "tool_call", _TOOL_CALL_KEYS)
+                else _tool_call_from_dict(tc)
                 for tc in tool_calls
             ]
         if invalid_tool_calls := values.get("invalid_tool_calls"):
             values["invalid_tool_calls"] = [
-                create_invalid_tool_call(**{k: v for k, v in tc.items() if k != "type"})
+                tc
+                if _is_typed_dict_of(tc, "invalid_tool_call", _INVALID_TOOL_CALL_KEYS)
+                else _invalid_tool_call_from_dict(tc)
                 for tc in invalid_tool_calls
             ]
 
         if tool_call_chunks := values.get("tool_call_chunks"):
             values["tool_call_chunks"] = [
-                create_tool_call_chunk(**{k: v for k, v in tc.items() if k != "type"})
+                tc
+                if _is_typed_dict_of(tc, "tool_call_chunk", _TOOL_CALL_CHUNK_KEYS)
+                else _tool_call_chunk_from_dict(tc)
                 for tc in tool_call_chunks
             ]
 
@@ -386,35 +477,34 @@ class AIMessage(BaseMessage):
             ```
         """  # noqa: E501
         base = super().pretty_repr(html=html)
-        lines = []
-
-        def _format_tool_args(tc: ToolCall | InvalidToolCall) -> list[str]:
-            lines = [
-                f"  {tc.get('name', 'Tool')} ({tc.get('id')})",
-                f" Call ID: {tc.get('id')}",
-            ]
-            if tc.get("error"):
-                lines.append(f"  Error: {tc.get('error')}")
-            lines.append("  Args:")
-            args = tc.get("args")
-            if isinstance(args, str):
-                lines.append(f"    {args}")
-            elif isinstance(args, dict):
-                for arg, value in args.items():
-                    lines.append(f"    {arg}: {value}")
-            return lines
+        lines: list[str] = []
 
         if self.tool_calls:
             lines.append("Tool Calls:")
             for tc in self.tool_calls:
-                lines.extend(_format_tool_args(tc))
+                _append_tool_args(lines, tc)
         if self.invalid_tool_calls:
             lines.append("Invalid Tool Calls:")
             for itc in self.invalid_tool_calls:
-                lines.extend(_format_tool_args(itc))
+                _append_tool_args(lines, itc)
         return (base.strip() + "\n" + "\n".join(lines)).strip()
 
 
+def _append_tool_args(out: list[str], tc: ToolCall | InvalidToolCall) -> None:
+    """Append the pretty representation of a tool call to `out`."""
+    id_ = tc.get("id")
+    out.append(f"  {tc.get('name', 'Tool')} ({id_})")
+    out.append(f" Call ID: {id_}")
+    if error := tc.get("error"):
+        out.append(f"  Error: {error}")
+    out.append("  Args:")
+    args = tc.get("args")
+    if isinstance(args, str):
+        out.append(f"    {args}")
+    elif isinstance(args, dict):
+        out.extend(f"    {arg}: {value}" for arg, value in args.items())
+
+
 class AIMessageChunk(AIMessage, BaseMessageChunk):
     """Message chunk from an AI (yielded when streaming)."""
 
@@ -516,57 +606,46 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
             ValueError: If the tool call chunks are malformed.
         """
         if not self.tool_call_chunks:
-            if self.tool_calls:
-                self.tool_call_chunks = [
+            if self.tool_calls or self.invalid_tool_calls:
+                tool_call_chunks = [
                     create_tool_call_chunk(
                         name=tc["name"],
-                        args=json.dumps(tc["args"]),
+                        args=_dumps_tool_args(tc["args"]),
                         id=tc["id"],
                         index=None,
                     )
                     for tc in self.tool_calls
                 ]
-            if self.invalid_tool_calls:
-                tool_call_chunks = self.tool_call_chunks
                 tool_call_chunks.extend(
-                    [
-                        create_tool_call_chunk(
-                            name=tc["name"], args=tc["args"], id=tc["id"], index=None
-                        )
-                        for tc in self.invalid_tool_calls
-                    ]
+                    create_tool_call_chunk(
+                        name=tc["name"], args=tc["args"], id=tc["id"], index=None
+                    )
+                    for tc in self.invalid_tool_calls
                 )
                 self.tool_call_chunks = tool_call_chunks
 
             return self
-        tool_calls = []
-        invalid_tool_calls = []
-
-        def add_chunk_to_invalid_tool_calls(chunk: ToolCallChunk) -> None:
-            invalid_tool_calls.append(
-                create_invalid_tool_call(
-                    name=chunk["name"],
-                    args=chunk["args"],
-                    id=chunk["id"],
-                    error=None,
-                )
-            )
-
+        tool_calls: list[ToolCall] = []
+        invalid_tool_calls: list[InvalidToolCall] = []
         for chunk in self.tool_call_chunks:
+            args_str = chunk["args"]
+            name = chunk["name"]
+            id_ = chunk["id"]
+            if not args_str:
+                tool_calls.append(create_tool_call(name=name or "", args={}, id=id_))
+                continue
             try:
-                args_ = parse_partial_json(chunk["args"]) if chunk["args"] else {}
-                if isinstance(args_, dict):
-                    tool_calls.append(
-                        create_tool_call(
-                            name=chunk["name"] or "",
-                            args=args_,
-                            id=chunk["id"],
-                        )
-                    )
-                else:
-                    add_chunk_to_invalid_tool_calls(chunk)
+                args_ = parse_partial_json(args_str)
             except Exception:
-                add_chunk_to_invalid_tool_calls(chunk)
+                args_ = None
+            if isinstance(args_, dict):
+                tool_calls.append(create_tool_call(name=name or "", args=args_, id=id_))
+            else:
+                invalid_tool_calls.append(
+                    create_invalid_tool_call(
+                        name=name, args=args_str, id=id_, error=None
+                    )
+                )
         self.tool_calls = tool_calls
         self.invalid_tool_calls = invalid_tool_calls
 
@@ -649,6 +728,22 @@ class AIMessageChunk(AIMessage, BaseMessageChunk):
         return super().__add__(other)
 
 
+def _id_rank(id_: str) -> int:
+    """Rank a message ID by order of preference when merging chunks.
+
+    Higher is better:
+
+    2. Provider-assigned IDs (non lc_* and non lc_run-*)
+    1. lc_run-* IDs
+    0. lc_* and other remaining IDs
+    """
+    # LC_ID_PREFIX ("lc_run-") extends LC_AUTO_PREFIX ("lc_"), so provider IDs are
+    # identified with a single prefix check.
+    if not id_.startswith(LC_AUTO_PREFIX):
+        return 2
+    return 1 if id_.startswith(LC_ID_PREFIX) else 0
+
+
 def add_ai_message_chunks(
     left: AIMessageChunk, *others: AIMessageChunk
 ) -> AIMessageChunk:
@@ -662,65 +757,81 @@ def add_ai_message_chunks(
         The resulting `AIMessageChunk`.
 
     """
-    content = merge_content(left.content, *(o.content for o in others))
-    additional_kwargs = merge_dicts(
-        left.additional_kwargs, *(o.additional_kwargs for o in others)
-    )
-    response_metadata = merge_dicts(
-        left.response_metadata, *(o.response_metadata for o in others)
-    )
+    chunk_id: str | None
+    chunk_position: Literal["last"] | None
+    if len(others) == 1:
+        # Specialized path for the common `left + right` case.
+        right = others[0]
+        content = merge_content(left.content, right.content)
+        additional_kwargs = merge_dicts(left.additional_kwargs, right.additional_kwargs)
+        response_metadata = merge_dicts(left.response_metadata, right.response_metadata)
+        raw_tool_calls = (
+            merge_lists(left.tool_call_chunks, right.tool_call_chunks)
+            if left.tool_call_chunks or right.tool_call_chunks
+            else None
+        )
+        usage_metadata = (
+            add_usage(left.usage_metadata, right.usage_metadata)
+            if left.usage_metadata or right.usage_metadata is not None
+            else None
+        )
+        chunk_position = (
+            "last"
+            if left.chunk_position == "last" or right.chunk_position == "last"
+            else None
+        )
+        if left.id and (not right.id or _id_rank(left.id) >= _id_rank(right.id)):
+            chunk_id = left.id
+        else:
+            chunk_id = right.id or None
+    else:
+        # Gather every field in a single pass over the chunks.
+        contents = []
+        additional_kwargs_list = []
+        response_metadata_list = []
+        tool_call_chunks_list = []
+        usage_metadata = left.usage_metadata or None
+        chunk_position = left.chunk_position
+        best_rank = -1
+        chunk_id = None
+
+        for i, msg in enumerate((left, *others)):
+            contents.append(msg.content)
+            additional_kwargs_list.append(msg.additional_kwargs)
+            response_metadata_list.append(msg.response_metadata)
+            tool_call_chunks_list.append(msg.tool_call_chunks)
+
+            if i and msg.usage_metadata is not None:
+                usage_metadata = add_usage(usage_metadata, msg.usage_metadata)
+
+            if msg.chunk_position == "last":
+                chunk_position = "last"
+
+            # The first ID of the highest rank wins
+            if (id_ := msg.id) and (rank := _id_rank(id_)) > best_rank:
+                best_rank = rank
+                chunk_id = id_
+
+        content = merge_content(*contents)
+        additional_kwargs = merge_dicts(*additional_kwargs_list)
+        response_metadata = merge_dicts(*response_metadata_list)
+        raw_tool_calls = merge_lists(*tool_call_chunks_list)
 
     # Merge tool call chunks
-    if raw_tool_calls := merge_lists(
-        left.tool_call_chunks, *(o.tool_call_chunks for o in others)
-    ):
+    if raw_tool_calls:
         tool_call_chunks = [
-            create_tool_call_chunk(
+            ToolCallChunk(
                 name=rtc.get("name"),
                 args=rtc.get("args"),
-                index=rtc.get("index"),
                 id=rtc.get("id"),
+                index=rtc.get("index"),
+                type="tool_call_chunk",
             )
             for rtc in raw_tool_calls
         ]
     else:
         tool_call_chunks = []
 
-    # Token usage
-    if left.usage_metadata or any(o.usage_metadata is not None for o in others):
-        usage_metadata: UsageMetadata | None = left.usage_metadata
-        for other in others:
-            usage_metadata = add_usage(usage_metadata, other.usage_metadata)
-    else:
-        usage_metadata = None
-
-    # Ranks are defined by the order of preference. Higher is better:
-    # 2. Provider-assigned IDs (non lc_* and non lc_run-*)
-    # 1. lc_run-* IDs
-    # 0. lc_* and other remaining IDs
-    best_rank = -1
-    chunk_id = None
-    candidates = itertools.chain([left.id], (o.id for o in others))
-
-    for id_ in candidates:
-        if not id_:
-            continue
-
-        if not id_.startswith(LC_ID_PREFIX) and not id_.startswith(LC_AUTO_PREFIX):
-            chunk_id = id_
-            # Highest rank, return instantly
-            break
-
-        rank = 1 if id_.startswith(LC_ID_PREFIX) else 0
-
-        if rank > best_rank:
-            best_rank = rank
-            chunk_id = id_
-
-    chunk_position: Literal["last"] | None = (
-        "last" if any(x.chunk_position == "last" for x in [left, *others]) else None
-    )
-
     return left.__class__(
         content=content,
         additional_kwargs=additional_kwargs,
@@ -732,6 +843,31 @@ def add_ai_message_chunks(
     )
 
 
+def _combine_usage(
+    left: UsageMetadata, right: UsageMetadata, op: Callable[[int, int], int]
+) -> UsageMetadata:
+    """Apply `op` to the token counts of two `UsageMetadata` objects.
+
+    When both sides only carry integer top-level counts they are combined directly;
+    anything else (token details, provider-specific keys, missing or non-integer
+    counts) goes through `_dict_int_op` so it is validated the same way.
+    """
+    if (
+        left.keys() == _BASE_USAGE_KEYS
+        and right.keys() == _BASE_USAGE_KEYS
+        and all(isinstance(v, int) for d in (left, right) for v in d.values())
+    ):
+        return UsageMetadata(
+            input_tokens=op(left["input_tokens"], right["input_tokens"]),
+            output_tokens=op(left["output_tokens"], right["output_tokens"]),
+            total_tokens=op(left["total_tokens"], right["total_tokens"]),
+        )
+    return cast(
+        "UsageMetadata",
+        _dict_int_op(cast("dict[str, Any]", left), cast("dict[str, Any]", right), op),
+    )
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
@@ -779,16 +915,7 @@ def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageM
     if not (left and right):
         return cast("UsageMetadata", left or right)
 
-    return UsageMetadata(
-        **cast(
-            "UsageMetadata",
-            _dict_int_op(
-                cast("dict[str, Any]", left),
-                cast("dict[str, Any]", right),
-                operator.add,
-            ),
-        )
-    )
+    return _combine_usage(left, right, operator.add)
 
 
 def subtract_usage(
@@ -842,13 +969,4 @@ def subtract_usage(
     if not (left and right):
         return cast("UsageMetadata", left or right)
 
-    return UsageMetadata(
-        **cast(
-            "UsageMetadata",
-            _dict_int_op(
-                cast("dict[str, Any]", left),
-                cast("dict[str, Any]", right),
-                (lambda le, ri: max(le - ri, 0)),
-            ),
-        )
-    )
+    return _combine_usage(left, right, lambda le, ri: max(le - ri, 0))
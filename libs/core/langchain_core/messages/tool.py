@@ -1,6 +1,7 @@
 """Messages for tools."""
 
 import json
+from collections.abc import Mapping
 from typing import Any, Literal, cast, overload
 from uuid import UUID
 
@@ -346,6 +347,69 @@ def invalid_tool_call(
     )
 
 
+def _check_tool_call_keys(
+    tc: Mapping[str, Any],
+    allowed: frozenset[str],
+    kind: str,
+    required: frozenset[str] = frozenset(),
+) -> None:
+    """Raise a `TypeError` if `tc` has unknown keys or lacks required keys."""
+    if unexpected := tc.keys() - allowed:
+        msg = f"{kind} got unexpected keys: {sorted(unexpected)}"
+        raise TypeError(msg)
+    if missing := required - tc.keys():
+        msg = f"{kind} is missing required keys: {sorted(missing)}"
+        raise TypeError(msg)
+
+
+_TOOL_CALL_FIELDS = frozenset(("name", "args", "id"))
+_TOOL_CALL_ALLOWED_KEYS = _TOOL_CALL_FIELDS | {"type", "extras"}
+_INVALID_TOOL_CALL_ALLOWED_KEYS = frozenset(("name", "args", "id", "error", "type"))
+_TOOL_CALL_CHUNK_ALLOWED_KEYS = frozenset(("name", "args", "id", "index", "type"))
+
+
+def _tool_call_from_dict(tc: Mapping[str, Any]) -> ToolCall:
+    """Build a `ToolCall` from a tool call-like dict.
+
+    `type` and `extras` are dropped. Any other unknown key, or a missing `name`,
+    `args` or `id`, raises a `TypeError`.
+    """
+    _check_tool_call_keys(tc, _TOOL_CALL_ALLOWED_KEYS, "ToolCall", _TOOL_CALL_FIELDS)
+    return ToolCall(name=tc["name"], args=tc["args"], id=tc["id"], type="tool_call")
+
+
+def _tool_call_chunk_from_dict(tc: Mapping[str, Any]) -> ToolCallChunk:
+    """Build a `ToolCallChunk` from a chunk-like dict.
+
+    `type` is dropped and missing keys default to `None`. Any other unknown key
+    raises a `TypeError`.
+    """
+    _check_tool_call_keys(tc, _TOOL_CALL_CHUNK_ALLOWED_KEYS, "ToolCallChunk")
+    return ToolCallChunk(
+        name=tc.get("name"),
+        args=tc.get("args"),
+        id=tc.get("id"),
+        index=tc.get("index"),
+        type="tool_call_chunk",
+    )
+
+
+def _invalid_tool_call_from_dict(tc: Mapping[str, Any]) -> InvalidToolCall:
+    """Build an `InvalidToolCall` from a dict.
+
+    `type` is dropped and missing keys default to `None`. Any other unknown key
+    raises a `TypeError`.
+    """
+    _check_tool_call_keys(tc, _INVALID_TOOL_CALL_ALLOWED_KEYS, "InvalidToolCall")
+    return InvalidToolCall(
+        name=tc.get("name"),
+        args=tc.get("args"),
+        id=tc.get("id"),
+        error=tc.get("error"),
+        type="invalid_tool_call",
+    )
+
+
 def default_tool_parser(
     raw_tool_calls: list[dict[str, Any]],
 ) -> tuple[list[ToolCall], list[InvalidToolCall]]:
@@ -1,4 +1,12 @@
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
 from typing import Any, cast
+from uuid import UUID
+
+import pytest
 
 from langchain_core.load import dumpd, load
 from langchain_core.messages import AIMessage, AIMessageChunk
@@ -576,3 +584,318 @@ def test_content_blocks_reasoning_extraction() -> None:
     content_blocks = message.content_blocks
     assert len(content_blocks) == 1
     assert content_blocks[0]["type"] == "text"
+
+
+def test_init_tool_call_chunks_from_tool_calls() -> None:
+    chunk = AIMessageChunk(
+        content="",
+        tool_calls=[
+            create_tool_call(name="foo", args={"a": [1, 2]}, id="1"),
+            create_tool_call(name="bar", args={"big": 2**70}, id="2"),
+        ],
+    )
+    assert [json.loads(tcc["args"] or "") for tcc in chunk.tool_call_chunks] == [
+        {"a": [1, 2]},
+        {"big": 2**70},
+    ]
+
+
+def test_init_tool_calls_from_chunks_not_shared() -> None:
+    chunks = [create_tool_call_chunk(name="foo", args='{"a": {"b": 1', id="1", index=0)]
+    first = AIMessageChunk(content="", tool_call_chunks=chunks)
+    first.tool_calls[0]["args"]["a"]["b"] = 2
+    second = AIMessageChunk(content="", tool_call_chunks=chunks)
+    assert second.tool_calls[0]["args"] == {"a": {"b": 1}}
+
+
+def test_add_subtract_usage_mixed_details() -> None:
+    usage1 = UsageMetadata(input_tokens=10, output_tokens=20, total_tokens=30)
+    usage2 = UsageMetadata(
+        input_tokens=5,
+        output_tokens=10,
+        total_tokens=15,
+        input_token_details=InputTokenDetails(cache_read=3),
+    )
+    assert add_usage(usage1, usage2) == UsageMetadata(
+        input_tokens=15,
+        output_tokens=30,
+        total_tokens=45,
+        input_token_details=InputTokenDetails(cache_read=3),
+    )
+    assert subtract_usage(usage1, usage2) == UsageMetadata(
+        input_tokens=5,
+        output_tokens=10,
+        total_tokens=15,
+        input_token_details=InputTokenDetails(cache_read=0),
+    )
+
+
+@pytest.mark.parametrize("total_tokens", [None, 1.5])
+def test_add_subtract_usage_rejects_non_int_counts(total_tokens: Any) -> None:
+    usage1 = UsageMetadata(input_tokens=1, output_tokens=2, total_tokens=3)
+    usage2 = cast(
+        "UsageMetadata",
+        {"input_tokens": 1, "output_tokens": 2, "total_tokens": total_tokens},
+    )
+    with pytest.raises(ValueError, match="Unknown value types"):
+        add_usage(usage1, usage2)
+    with pytest.raises(ValueError, match="Unknown value types"):
+        subtract_usage(usage2, usage1)
+
+
+def test_add_ai_message_chunks_id_precedence() -> None:
+    auto = AIMessageChunk(content="", id="lc_abc")
+    run = AIMessageChunk(content="", id="lc_run--abc")
+    provider = AIMessageChunk(content="", id="msg_abc")
+    other_provider = AIMessageChunk(content="", id="msg_def")
+    empty = AIMessageChunk(content="", id="")
+
+    # Pairwise and n-ary merges pick the same ID
+    assert add_ai_message_chunks(auto, run).id == "lc_run--abc"
+    assert add_ai_message_chunks(run, auto).id == "lc_run--abc"
+    assert add_ai_message_chunks(auto, empty, run).id == "lc_run--abc"
+    assert add_ai_message_chunks(provider, other_provider).id == "msg_abc"
+    assert add_ai_message_chunks(run, other_provider, provider).id == "msg_def"
+    assert add_ai_message_chunks(empty, empty).id is None
+    assert add_ai_message_chunks(empty).id is None
+
+
+def test_add_ai_message_chunks_without_new_tool_call_chunks() -> None:
+    left = AIMessageChunk(
+        content="",
+        tool_call_chunks=[
+            create_tool_call_chunk(name="foo", args='{"a": {"b": 1}}', id="1", index=0),
+            create_tool_call_chunk(name="bar", args="[1]", id="2", index=1),
+        ],
+    )
+    right = AIMessageChunk(content="done", id="msg_abc")
+    result = left + right
+    expected = AIMessageChunk(
+        content="done", tool_call_chunks=left.tool_call_chunks, id="msg_abc"
+    )
+    assert result == expected
+    assert result.tool_calls == [
+        create_tool_call(name="foo", args={"a": {"b": 1}}, id="1")
+    ]
+    assert result.invalid_tool_calls == [
+        create_invalid_tool_call(name="bar", args="[1]", id="2", error=None)
+    ]
+    assert result.tool_calls[0] is not left.tool_calls[0]
+    assert result.tool_calls[0]["args"] is not left.tool_calls[0]["args"]
+
+    result.tool_calls[0]["args"]["a"]["b"] = 99
+    assert left.tool_calls[0]["args"] == {"a": {"b": 1}}
+
+
+def test_add_ai_message_chunks_matches_validated_construction() -> None:
+    raw_tool_call = {
+        "index": 0,
+        "id": "call_1",
+        "function": {"name": "foo", "arguments": '{"a": 1}'},
+    }
+    left = AIMessageChunk(content=["hello"], id="lc_run--abc")
+    right = AIMessageChunk(
+        content="",
+        additional_kwargs={"tool_calls": [raw_tool_call]},
+        usage_metadata=UsageMetadata(input_tokens=1, output_tokens=2, total_tokens=3),
+        chunk_position="last",
+    )
+    result = left + right
+    expected = AIMessageChunk(
+        content=["hello"],
+        additional_kwargs={"tool_calls": [raw_tool_call]},
+        usage_metadata=UsageMetadata(input_tokens=1, output_tokens=2, total_tokens=3),
+        id="lc_run--abc",
+        chunk_position="last",
+    )
+    assert result == expected
+    assert result.tool_calls == [
+        create_tool_call(name="foo", args={"a": 1}, id="call_1")
+    ]
+
+    # The result doesn't share mutable fields with its inputs
+    assert result.content is not left.content
+    assert result.usage_metadata is not right.usage_metadata
+
+
+def test_pretty_repr_tool_calls() -> None:
+    msg = AIMessage(
+        content="Let me check the weather.",
+        tool_calls=[{"name": "get_weather", "args": {"city": "Paris"}, "id": "1"}],
+        invalid_tool_calls=[
+            create_invalid_tool_call(
+                name="get_time", args="{bad", id="2", error="Invalid JSON"
+            )
+        ],
+    )
+    assert msg.pretty_repr().splitlines()[1:] == [
+        "",
+        "Let me check the weather.",
+        "Tool Calls:",
+        "  get_weather (1)",
+        " Call ID: 1",
+        "  Args:",
+        "    city: Paris",
+        "Invalid Tool Calls:",
+        "  get_time (2)",
+        " Call ID: 2",
+        "  Error: Invalid JSON",
+        "  Args:",
+        "    {bad",
+    ]
+
+
+def test_init_tool_calls_complete_and_partial_args() -> None:
+    chunk = AIMessageChunk(
+        content="",
+        tool_call_chunks=[
+            create_tool_call_chunk(
+                name="foo", args=f'{{"a": "x\ny", "b": {2**70}}}', id="1", index=0
+            ),
+            create_tool_call_chunk(name="bar", args='{"a": [1, {"b": "c', id="2"),
+        ],
+    )
+    assert chunk.tool_calls == [
+        create_tool_call(name="foo", args={"a": "x\ny", "b": 2**70}, id="1"),
+        create_tool_call(name="bar", args={"a": [1, {"b": "c"}]}, id="2"),
+    ]
+
+
+def test_backwards_compat_tool_calls_normalizes_dicts() -> None:
+    chunk = AIMessageChunk(
+        content="",
+        tool_calls=[
+            create_tool_call(name="foo", args={"a": 1}, id="1"),
+            {"name": "bar", "args": {}, "id": "2", "type": "other"},
+        ],
+        invalid_tool_calls=[{"name": "baz", "args": "{", "id": "3", "error": None}],
+    )
+    assert chunk.tool_calls == [
+        create_tool_call(name="foo", args={"a": 1}, id="1"),
+        create_tool_call(name="bar", args={}, id="2"),
+    ]
+    assert chunk.invalid_tool_calls == [
+        create_invalid_tool_call(name="baz", args="{", id="3", error=None)
+    ]
+
+    # `extras` is only dropped from tool calls
+    chunk = AIMessageChunk(
+        content="",
+        tool_calls=[{"name": "foo", "args": {}, "id": "1", "extras": {"x": 1}}],
+    )
+    assert chunk.tool_calls == [create_tool_call(name="foo", args={}, id="1")]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"tool_calls": [{"nme": "foo", "args": {}, "id": "1"}]},
+        {"tool_calls": [{"name": "foo", "args": {}}]},
+        {"invalid_tool_calls": [{"name": "foo", "extras": {}}]},
+        {"tool_call_chunks": [{"name": "foo", "extras": {}}]},
+    ],
+)
+def test_backwards_compat_tool_calls_rejects_bad_keys(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(TypeError):
+        AIMessageChunk(content="", **kwargs)
+
+
+@pytest.mark.parametrize("has_orjson", [True, False])
+def test_init_tool_call_chunks_non_json_native_args(
+    monkeypatch: pytest.MonkeyPatch, *, has_orjson: bool
+) -> None:
+    class Color(Enum):
+        RED = "red"
+
+    @dataclass
+    class Point:
+        x: int
+
+    if not has_orjson:
+        monkeypatch.setattr("langchain_core.messages.ai._HAS_ORJSON", False)
+    args = {
+        "when": datetime(2020, 1, 1, tzinfo=timezone.utc),
+        "color": Color.RED,
+        "point": Point(x=1),
+        "id": UUID(int=1),
+        "s": "é",
+        "nan": float("nan"),
+        "inf": [float("inf"), {"neg": float("-inf")}],
+    }
+    chunk = AIMessageChunk(
+        content="", tool_calls=[create_tool_call(name="foo", args=args, id="1")]
+    )
+    assert chunk.tool_call_chunks[0]["args"] == (
+        '{"when":"2020-01-01 00:00:00+00:00","color":"red","point":"'
+        + str(Point(x=1))
+        + '","id":"00000000-0000-0000-0000-000000000001","s":"é",'
+        + '"nan":null,"inf":[null,{"neg":null}]}'
+    )
+
+
+def test_add_ai_message_chunks_does_not_mutate_inputs() -> None:
+    left = AIMessageChunk(
+        content=[
+            {"type": "text", "text": "hi"},
+            {
+                "type": "server_tool_call_chunk",
+                "args": '{"q": 1}',
+                "id": "s",
+                "name": "n",
+            },
+        ],
+        response_metadata={"output_version": "v1"},
+        usage_metadata=UsageMetadata(
+            input_tokens=1,
+            output_tokens=2,
+            total_tokens=3,
+            input_token_details=InputTokenDetails(cache_read=1),
+        ),
+    )
+    right = AIMessageChunk(content="", chunk_position="last")
+    left_before = left.model_copy(deep=True)
+    right_before = right.model_copy(deep=True)
+
+    merged = left + right
+    assert merged.content[1] == {
+        "type": "server_tool_call",
+        "args": {"q": 1},
+        "id": "s",
+        "name": "n",
+    }
+    assert left == left_before
+    assert right == right_before
+
+    # Editing the result doesn't reach back into the inputs either
+    cast("dict[str, Any]", merged.content[0])["text"] = "changed"
+    assert merged.usage_metadata is not None
+    merged.usage_metadata["input_token_details"]["cache_read"] = 99
+    assert left == left_before
+
+
+def test_add_ai_message_chunks_performance() -> None:
+    """Merging chunks should cost about as much as constructing one.
+
+    Compared against plain construction so the check doesn't depend on how fast
+    the machine is. Merging currently takes ~2-3x a construction; a regression
+    that, e.g., re-resolves field defaults on every merge pushes it past 40x.
+    """
+    n = 1_000
+    chunks = [AIMessageChunk(content="tok ") for _ in range(n)]
+
+    def construct() -> float:
+        tic = time.perf_counter()
+        for _ in range(n):
+            AIMessageChunk(content="tok ")
+        return time.perf_counter() - tic
+
+    def merge() -> float:
+        tic = time.perf_counter()
+        full = chunks[0]
+        for chunk in chunks[1:]:
+            full += chunk
+        return time.perf_counter() - tic
+
+    construct_time = min(construct() for _ in range(3))
+    merge_time = min(merge() for _ in range(3))
+    assert merge_time < 10 * construct_time